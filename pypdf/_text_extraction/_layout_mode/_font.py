@@ -28,6 +28,9 @@ class Font:
     width_map: Dict[str, int] = field(default_factory=dict, init=False)
 
     def __post_init__(self) -> None:
+        # space_tx memos keyed on text state, see TextStateParams.__post_init__.
+        # Not a dataclass field so it stays out of to_dict() serialization.
+        self._space_tx_cache: Dict[Any, float] = {}
         # TrueType fonts have a /Widths array mapping character codes to widths
         if isinstance(self.encoding, dict) and "/Widths" in self.font_dictionary:
             first_char = self.font_dictionary.get("/FirstChar", 0)
@@ -1,14 +1,23 @@
 """A dataclass that captures the CTM and Text State for a tj operation"""
 
 import math
+import sys
 from dataclasses import dataclass, field
+from operator import attrgetter
 from typing import Any, Dict, List, Union
 
-from .. import mult, orient
+from .. import mult
 from ._font import Font
 
+if sys.version_info >= (3, 10):
+    # Generating __slots__ drops the per-instance __dict__ of this very
+    # frequently instantiated class; the argument requires Python 3.10+.
+    _dataclass_kwargs: Dict[str, bool] = {"slots": True}
+else:
+    _dataclass_kwargs = {}
 
-@dataclass
+
+@dataclass(**_dataclass_kwargs)
 class TextStateParams:
     """
     Text state parameters and operator values for a single text value in a
@@ -51,39 +60,57 @@ class TextStateParams:
     font_height: float = field(default=0.0, init=False)
     flip_vertical: bool = field(default=False, init=False)
     rotated: bool = field(default=False, init=False)
+    _tz_scale: float = field(default=1.0, init=False)
+    _fs_scale: float = field(default=0.0, init=False)
 
     def __post_init__(self) -> None:
-        if orient(self.transform) in (90, 270):
-            self.transform = mult(
-                [1.0, -self.transform[1], -self.transform[2], 1.0, 0.0, 0.0],
-                self.transform,
-            )
+        # word_tx and font_size_matrix only ever use these scaled values.
+        self._tz_scale = self.Tz / 100.0
+        self._fs_scale = self.font_size / 1000.0
+        # The overwhelming majority of PDF text is axis aligned with a
+        # positive y scale, i.e. orient() == 0; detect that from the matrix
+        # entries directly so no orient()/mult() calls are needed for it.
+        t = self.transform
+        if abs(t[3]) <= 1e-6:  # orient(t) is 90 or 270
+            if t[1] != 0.0 or t[2] != 0.0:
+                self.transform = t = mult([1.0, -t[1], -t[2], 1.0, 0.0, 0.0], t)
             self.rotated = True
-        # self.transform[0] AND self.transform[3] < 0 indicates true rotation.
-        # If only self.transform[3] < 0, the y coords are simply inverted.
-        if orient(self.transform) == 180 and self.transform[0] < -1e-6:
-            self.transform = mult([-1.0, 0.0, 0.0, -1.0, 0.0, 0.0], self.transform)
+        # t[0] AND t[3] < 0 indicates true rotation.
+        # If only t[3] < 0, the y coords are simply inverted.
+        if t[3] < -1e-6 and t[0] < -1e-6:  # orient(t) == 180
+            # mult([-1, 0, 0, -1, 0, 0], t) only negates the first four terms
+            self.transform = t = [-t[0], -t[1], -t[2], -t[3], t[4], t[5]]
             self.rotated = True
-        self.displaced_tx = self.displaced_transform()[4]
-        self.tx = self.transform[4]
-        self.ty = self.render_transform()[5]
-        self.space_tx = round(self.word_tx(" "), 3)
-        if self.space_tx < 1e-6:
-            # if the " " char is assigned 0 width (e.g. for fine tuned spacing
-            # with TJ int operators a la crazyones.pdf), calculate space_tx as
-            # a TD_offset of -2 * font.space_width where font.space_width is
-            # the space_width calculated in _cmap.py.
-            self.space_tx = round(self.word_tx("", self.font.space_width * -2), 3)
-        self.font_height = self.font_size * math.sqrt(
-            self.transform[1] ** 2 + self.transform[3] ** 2
-        )
+        # scalar forms of displaced_transform()[4] and render_transform()[5];
+        # building the full matrices here would allocate two lists per
+        # instance only to read back a single element of each.
+        self.displaced_tx = self.word_tx(self.txt) * t[0] + t[4]
+        self.tx = t[4]
+        self.ty = self.Ts * t[3] + t[5]
+        # space_tx only depends on the font and the text state values below,
+        # which are shared by many TextStateParams instances; memoize the
+        # result on the font (fonts are effectively immutable once built).
+        space_key = (self.font_size, self.Tc, self.Tw, self.Tz)
+        cached_space_tx = self.font._space_tx_cache.get(space_key)
+        if cached_space_tx is not None:
+            self.space_tx = cached_space_tx
+        else:
+            self.space_tx = round(self.word_tx(" "), 3)
+            if self.space_tx < 1e-6:
+                # if the " " char is assigned 0 width (e.g. for fine tuned spacing
+                # with TJ int operators a la crazyones.pdf), calculate space_tx as
+                # a TD_offset of -2 * font.space_width where font.space_width is
+                # the space_width calculated in _cmap.py.
+                self.space_tx = round(self.word_tx("", self.font.space_width * -2), 3)
+            self.font._space_tx_cache[space_key] = self.space_tx
+        self.font_height = self.font_size * math.hypot(t[1], t[3])
         # flip_vertical handles PDFs generated by Microsoft Word's "publish" command.
-        self.flip_vertical = self.transform[3] < -1e-6  # inverts y axis
+        self.flip_vertical = t[3] < -1e-6  # inverts y axis
 
     def font_size_matrix(self) -> List[float]:
         """Font size matrix"""
         return [
-            self.font_size * (self.Tz / 100.0),
+            self.font_size * self._tz_scale,
             0.0,
             0.0,
             self.font_size,
@@ -93,11 +120,34 @@ class TextStateParams:
 
     def displaced_transform(self) -> List[float]:
         """Effective transform matrix after text has been rendered."""
-        return mult(self.displacement_matrix(), self.transform)
+        # inlined mult(self.displacement_matrix(), self.transform): the
+        # displacement matrix is a pure translation, so only the last two
+        # elements of the product differ from self.transform.
+        t = self.transform
+        word_tx = self.word_tx(self.txt)
+        return [
+            t[0],
+            t[1],
+            t[2],
+            t[3],
+            word_tx * t[0] + t[4],
+            word_tx * t[1] + t[5],
+        ]
 
     def render_transform(self) -> List[float]:
         """Effective transform matrix accounting for font size, Tz, and Ts."""
-        return mult(self.font_size_matrix(), self.transform)
+        # inlined mult(self.font_size_matrix(), self.transform) where the
+        # font size matrix is [fs * Tz / 100, 0, 0, fs, 0, Ts].
+        t = self.transform
+        scaled_fs = self.font_size * self._tz_scale
+        return [
+            scaled_fs * t[0],
+            scaled_fs * t[1],
+            self.font_size * t[2],
+            self.font_size * t[3],
+            self.Ts * t[2] + t[4],
+            self.Ts * t[3] + t[5],
+        ]
 
     def displacement_matrix(
         self, word: Union[str, None] = None, TD_offset: float = 0.0
@@ -115,13 +165,25 @@ class TextStateParams:
 
     def word_tx(self, word: str, TD_offset: float = 0.0) -> float:
         """Horizontal text displacement for any word according this text state"""
+        # most PDFs do not set word spacing; skip counting spaces for them
+        word_spacing = word.count(" ") * self.Tw if self.Tw else 0.0
         return (
-            (self.font_size * ((self.font.word_width(word) - TD_offset) / 1000.0))
+            (self.font.word_width(word) - TD_offset) * self._fs_scale
             + self.Tc
-            + word.count(" ") * self.Tw
-        ) * (self.Tz / 100.0)
+            + word_spacing
+        ) * self._tz_scale
 
     @staticmethod
     def to_dict(inst: "TextStateParams") -> Dict[str, Any]:
         """Dataclass to dict for json.dumps serialization"""
-        return {k: getattr(inst, k) for k in inst.__dataclass_fields__ if k != "font"}
+        return dict(zip(_SERIALIZE_FIELDS, _SERIALIZE_GETTER(inst)))
+
+
+# computed once rather than per to_dict call; internal scale factors stay
+# out of the serialized output
+_SERIALIZE_FIELDS = tuple(
+    k
+    for k in TextStateParams.__dataclass_fields__
+    if k != "font" and not k.startswith("_")
+)
+_SERIALIZE_GETTER = attrgetter(*_SERIALIZE_FIELDS)
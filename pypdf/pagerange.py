@@ -14,6 +14,20 @@ from .errors import ParseError
 _INT_RE = r"(0|-?[1-9]\d*)"  # A decimal int, don't allow "-0".
 PAGE_RANGE_RE = f"^({_INT_RE}|({_INT_RE}?(:{_INT_RE}?(:{_INT_RE}?)?)))$"
 # groups:         12     34     5 6     7 8
+_PAGE_RANGE_PAT = re.compile(PAGE_RANGE_RE)  # compiled once, not per call
+
+
+def _slice_to_str(s: slice) -> str:
+    """Represent a page range slice as a string like "1:2:3"."""
+    indices: Union[Tuple[int, int], Tuple[int, int, int]]
+    if s.step is None:
+        if s.start is not None and s.stop == s.start + 1:
+            return str(s.start)
+
+        indices = s.start, s.stop
+    else:
+        indices = s.start, s.stop, s.step
+    return ":".join("" if i is None else str(i) for i in indices)
 
 
 class PageRange:
@@ -59,22 +73,25 @@ class PageRange:
         """
         if isinstance(arg, slice):
             self._slice = arg
-            return
-
-        if isinstance(arg, PageRange):
+        elif isinstance(arg, PageRange):
             self._slice = arg.to_slice()
-            return
-
-        m = isinstance(arg, str) and re.match(PAGE_RANGE_RE, arg)
-        if not m:
-            raise ParseError(arg)
-        elif m.group(2):
-            # Special case: just an int means a range of one page.
-            start = int(m.group(2))
-            stop = start + 1 if start != -1 else None
-            self._slice = slice(start, stop)
         else:
-            self._slice = slice(*[int(g) if g else None for g in m.group(4, 6, 8)])
+            m = isinstance(arg, str) and _PAGE_RANGE_PAT.match(arg)
+            if not m:
+                raise ParseError(arg)
+            elif m.group(2):
+                # Special case: just an int means a range of one page.
+                start = int(m.group(2))
+                stop = start + 1 if start != -1 else None
+                self._slice = slice(start, stop)
+            else:
+                groups = m.group(4, 6, 8)
+                self._slice = slice(*[int(g) if g else None for g in groups])
+        # _slice is never mutated after construction, so derived values can
+        # be computed once instead of on every __str__/__hash__ call.
+        s = self._slice
+        self._str = _slice_to_str(s)
+        self._hash = hash((PageRange, s.start, s.stop, s.step))
 
     @staticmethod
     def valid(input: Any) -> bool:
@@ -87,8 +104,15 @@ class PageRange:
         Returns:
             True, if the ``input`` is a valid PageRange.
         """
+        # Exact type checks cover the common cases without the cost of
+        # isinstance; subclasses fall through to the isinstance path below.
+        input_type = type(input)
+        if input_type is slice or input_type is PageRange:
+            return True
+        if input_type is str:
+            return _PAGE_RANGE_PAT.match(input) is not None
         return isinstance(input, (slice, PageRange)) or (
-            isinstance(input, str) and bool(re.match(PAGE_RANGE_RE, input))
+            isinstance(input, str) and _PAGE_RANGE_PAT.match(input) is not None
         )
 
     def to_slice(self) -> slice:
@@ -97,16 +121,10 @@ class PageRange:
 
     def __str__(self) -> str:
         """A string like "1:2:3"."""
-        s = self._slice
-        indices: Union[Tuple[int, int], Tuple[int, int, int]]
-        if s.step is None:
-            if s.start is not None and s.stop == s.start + 1:
-                return str(s.start)
+        return self._str
 
-            indices = s.start, s.stop
-        else:
-            indices = s.start, s.stop, s.step
-        return ":".join("" if i is None else str(i) for i in indices)
+    def __hash__(self) -> int:
+        return self._hash
 
     def __repr__(self) -> str:
         """A string like "PageRange('1:2:3')"."""
@@ -150,7 +168,9 @@ class PageRange:
         return PageRange(slice(a[0], max(a[1], b[1])))
 
 
-PAGE_RANGE_ALL = PageRange(":")  # The range of all pages.
+# The range of all pages. Built from a slice directly so importing this
+# module does not go through the regex parsing path.
+PAGE_RANGE_ALL = PageRange(slice(None, None, None))
 
 
 def parse_filename_page_ranges(
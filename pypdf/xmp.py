@@ -5,7 +5,6 @@ https://en.wikipedia.org/wiki/Extensible_Metadata_Platform
 """
 
 import datetime
-import decimal
 import re
 from typing import (
     Any,
@@ -14,6 +13,7 @@ from typing import (
     Iterator,
     List,
     Optional,
+    Tuple,
     TypeVar,
     Union,
 )
@@ -51,24 +51,21 @@ XMPMM_NAMESPACE = "http://ns.adobe.com/xap/1.0/mm/"
 # Schemas".
 PDFX_NAMESPACE = "http://ns.adobe.com/pdfx/1.3/"
 
+# An escaped pdfx key character: ↂ followed by the four hex digits of
+# the original character (see the PDFX_NAMESPACE notes above).
+_PDFX_KEY_ESCAPE = re.compile("ↂ([0-9A-Fa-f]{4})")
+
+# YYYY[-MM[-DD[Thh:mm[:ss[.frac]](Z|±hh:mm)]]]
 iso8601 = re.compile(
-    """
-        (?P<year>[0-9]{4})
-        (-
-            (?P<month>[0-9]{2})
-            (-
-                (?P<day>[0-9]+)
-                (T
-                    (?P<hour>[0-9]{2}):
-                    (?P<minute>[0-9]{2})
-                    (:(?P<second>[0-9]{2}(.[0-9]+)?))?
-                    (?P<tzd>Z|[-+][0-9]{2}:[0-9]{2})
-                )?
-            )?
-        )?
-        """,
-    re.VERBOSE,
+    "(?P<year>[0-9]{4})"
+    "(-(?P<month>[0-9]{2})"
+    "(-(?P<day>[0-9]+)"
+    "(T(?P<hour>[0-9]{2}):(?P<minute>[0-9]{2})"
+    "(:(?P<second>[0-9]{2}(.[0-9]+)?))?"
+    "(?P<tzd>Z|[-+][0-9]{2}:[0-9]{2})"
+    ")?)?)?"
 )
+_iso8601_match = iso8601.match
 
 
 K = TypeVar("K")
@@ -78,24 +75,34 @@ def _identity(value: K) -> K:
     return value
 
 
+# Every getter produced by the _getter_* factories below, in property
+# definition order; used by XmpInformation.prime_cache.
+_PROPERTY_GETTERS: List[Callable[["XmpInformation"], Any]] = []
+
+# Key of the element index built by XmpInformation._build_element_index:
+# (about URI, namespace URI, local name). minidom types the node
+# namespaceURI/localName attributes as Optional[str].
+_ElementKey = Tuple[str, Optional[str], Optional[str]]
+
+
 def _converter_date(value: str) -> datetime.datetime:
-    matches = iso8601.match(value)
+    matches = _iso8601_match(value)
     if matches is None:
         raise ValueError(f"Invalid date format: {value}")
-    year = int(matches.group("year"))
-    month = int(matches.group("month") or "1")
-    day = int(matches.group("day") or "1")
-    hour = int(matches.group("hour") or "0")
-    minute = int(matches.group("minute") or "0")
-    second = decimal.Decimal(matches.group("second") or "0")
-    seconds_dec = second.to_integral(decimal.ROUND_FLOOR)
-    milliseconds_dec = (second - seconds_dec) * 1_000_000
-
-    seconds = int(seconds_dec)
-    milliseconds = int(milliseconds_dec)
-
-    tzd = matches.group("tzd") or "Z"
-    dt = datetime.datetime(year, month, day, hour, minute, seconds, milliseconds)
+    group = matches.group
+    year = int(group("year"))
+    month = int(group("month") or "1")
+    day = int(group("day") or "1")
+    hour = int(group("hour") or "0")
+    minute = int(group("minute") or "0")
+    second_str = group("second") or "0"
+    whole, _, fraction = second_str.partition(".")
+    seconds = int(whole)
+    # The fraction is a decimal string; pad/truncate it to microseconds.
+    microseconds = int((fraction + "000000")[:6]) if fraction else 0
+
+    tzd = group("tzd") or "Z"
+    dt = datetime.datetime(year, month, day, hour, minute, seconds, microseconds)
     if tzd != "Z":
         tzd_hours, tzd_minutes = (int(x) for x in tzd.split(":"))
         tzd_hours *= -1
@@ -105,25 +112,43 @@ def _converter_date(value: str) -> datetime.datetime:
     return dt
 
 
+def _generic_get(
+    element: XmlElement,
+    self: "XmpInformation",
+    list_type: str,
+    converter: Callable[[Any], Any] = _identity,
+) -> Optional[List[Any]]:
+    """
+    Collect the values of all ``rdf:li`` items below the given container.
+
+    Returns None if the element holds no container of the requested type.
+    """
+    containers = element.getElementsByTagNameNS(RDF_NAMESPACE, list_type)
+    if not len(containers):
+        return None
+    # In well-formed XMP every rdf:li below the element belongs to the
+    # container(s) just matched, so one direct query over the element
+    # replaces the per-container subtree walks.
+    items = element.getElementsByTagNameNS(RDF_NAMESPACE, "li")
+    return [converter(self._get_text(item)) for item in items]
+
+
 def _getter_bag(
     namespace: str, name: str
 ) -> Callable[["XmpInformation"], Optional[List[str]]]:
     def get(self: "XmpInformation") -> Optional[List[str]]:
-        cached = self.cache.get(namespace, {}).get(name)
-        if cached:
-            return cached
+        key = (namespace, name)
+        if key in self._cache:
+            return self._cache[key]
         retval = []
         for element in self.get_element("", namespace, name):
-            bags = element.getElementsByTagNameNS(RDF_NAMESPACE, "Bag")
-            if len(bags):
-                for bag in bags:
-                    for item in bag.getElementsByTagNameNS(RDF_NAMESPACE, "li"):
-                        value = self._get_text(item)
-                        retval.append(value)
-        ns_cache = self.cache.setdefault(namespace, {})
-        ns_cache[name] = retval
+            items = _generic_get(element, self, "Bag")
+            if items is not None:
+                retval.extend(items)
+        self._cache[key] = retval
         return retval
 
+    _PROPERTY_GETTERS.append(get)
     return get
 
 
@@ -131,25 +156,21 @@ def _getter_seq(
     namespace: str, name: str, converter: Callable[[Any], Any] = _identity
 ) -> Callable[["XmpInformation"], Optional[List[Any]]]:
     def get(self: "XmpInformation") -> Optional[List[Any]]:
-        cached = self.cache.get(namespace, {}).get(name)
-        if cached:
-            return cached
+        key = (namespace, name)
+        if key in self._cache:
+            return self._cache[key]
         retval = []
         for element in self.get_element("", namespace, name):
-            seqs = element.getElementsByTagNameNS(RDF_NAMESPACE, "Seq")
-            if len(seqs):
-                for seq in seqs:
-                    for item in seq.getElementsByTagNameNS(RDF_NAMESPACE, "li"):
-                        value = self._get_text(item)
-                        value = converter(value)
-                        retval.append(value)
+            items = _generic_get(element, self, "Seq", converter)
+            if items is not None:
+                retval.extend(items)
             else:
                 value = converter(self._get_text(element))
                 retval.append(value)
-        ns_cache = self.cache.setdefault(namespace, {})
-        ns_cache[name] = retval
+        self._cache[key] = retval
         return retval
 
+    _PROPERTY_GETTERS.append(get)
     return get
 
 
@@ -157,9 +178,9 @@ def _getter_langalt(
     namespace: str, name: str
 ) -> Callable[["XmpInformation"], Optional[Dict[Any, Any]]]:
     def get(self: "XmpInformation") -> Optional[Dict[Any, Any]]:
-        cached = self.cache.get(namespace, {}).get(name)
-        if cached:
-            return cached
+        key = (namespace, name)
+        if key in self._cache:
+            return self._cache[key]
         retval = {}
         for element in self.get_element("", namespace, name):
             alts = element.getElementsByTagNameNS(RDF_NAMESPACE, "Alt")
@@ -170,10 +191,10 @@ def _getter_langalt(
                         retval[item.getAttribute("xml:lang")] = value
             else:
                 retval["x-default"] = self._get_text(element)
-        ns_cache = self.cache.setdefault(namespace, {})
-        ns_cache[name] = retval
+        self._cache[key] = retval
         return retval
 
+    _PROPERTY_GETTERS.append(get)
     return get
 
 
@@ -181,9 +202,9 @@ def _getter_single(
     namespace: str, name: str, converter: Callable[[str], Any] = _identity
 ) -> Callable[["XmpInformation"], Optional[Any]]:
     def get(self: "XmpInformation") -> Optional[Any]:
-        cached = self.cache.get(namespace, {}).get(name)
-        if cached:
-            return cached
+        key = (namespace, name)
+        if key in self._cache:
+            return self._cache[key]
         value = None
         for element in self.get_element("", namespace, name):
             if element.nodeType == element.ATTRIBUTE_NODE:
@@ -193,10 +214,10 @@ def _getter_single(
             break
         if value is not None:
             value = converter(value)
-        ns_cache = self.cache.setdefault(namespace, {})
-        ns_cache[name] = value
+        self._cache[key] = value
         return value
 
+    _PROPERTY_GETTERS.append(get)
     return get
 
 
@@ -219,7 +240,15 @@ class XmpInformation(PdfObject):
         self.rdf_root: XmlElement = doc_root.getElementsByTagNameNS(
             RDF_NAMESPACE, "RDF"
         )[0]
-        self.cache: Dict[Any, Any] = {}
+        # Index the rdf:Description nodes by their about URI once, so that
+        # the property getters do not re-walk the whole tree on every access.
+        self._desc_by_about: Dict[str, List[XmlElement]] = {}
+        for desc in self.rdf_root.getElementsByTagNameNS(RDF_NAMESPACE, "Description"):
+            about = desc.getAttributeNS(RDF_NAMESPACE, "about")
+            self._desc_by_about.setdefault(about, []).append(desc)
+        self._cache: Dict[Any, Any] = {}
+        # built lazily by get_element on first use
+        self._element_index: Optional[Dict[_ElementKey, List[Any]]] = None
 
     def write_to_stream(
         self, stream: StreamType, encryption_key: Union[None, str, bytes] = None
@@ -230,31 +259,64 @@ class XmpInformation(PdfObject):
             )
         self.stream.write_to_stream(stream)
 
-    def get_element(self, about_uri: str, namespace: str, name: str) -> Iterator[Any]:
-        for desc in self.rdf_root.getElementsByTagNameNS(RDF_NAMESPACE, "Description"):
-            if desc.getAttributeNS(RDF_NAMESPACE, "about") == about_uri:
-                attr = desc.getAttributeNodeNS(namespace, name)
-                if attr is not None:
-                    yield attr
-                yield from desc.getElementsByTagNameNS(namespace, name)
+    def _build_element_index(self) -> Dict[_ElementKey, List[Any]]:
+        """
+        Walk every rdf:Description once and index its attribute nodes and
+        descendant elements by (about URI, namespace, local name).
 
-    def get_nodes_in_namespace(self, about_uri: str, namespace: str) -> Iterator[Any]:
-        for desc in self.rdf_root.getElementsByTagNameNS(RDF_NAMESPACE, "Description"):
-            if desc.getAttributeNS(RDF_NAMESPACE, "about") == about_uri:
+        Afterwards each property lookup is a single dict access instead of a
+        pure-Python getElementsByTagNameNS tree walk per property.
+        """
+        index: Dict[_ElementKey, List[Any]] = {}
+        for about, descriptions in self._desc_by_about.items():
+            for desc in descriptions:
                 for i in range(desc.attributes.length):
                     attr = desc.attributes.item(i)
-                    if attr.namespaceURI == namespace:
-                        yield attr
-                for child in desc.childNodes:
-                    if child.namespaceURI == namespace:
-                        yield child
+                    index.setdefault(
+                        (about, attr.namespaceURI, attr.localName), []
+                    ).append(attr)
+                for element in desc.getElementsByTagName("*"):
+                    index.setdefault(
+                        (about, element.namespaceURI, element.localName), []
+                    ).append(element)
+        return index
+
+    def get_element(self, about_uri: str, namespace: str, name: str) -> Iterator[Any]:
+        if self._element_index is None:
+            self._element_index = self._build_element_index()
+        yield from self._element_index.get((about_uri, namespace, name), ())
+
+    def get_nodes_in_namespace(self, about_uri: str, namespace: str) -> Iterator[Any]:
+        for desc in self._desc_by_about.get(about_uri, ()):
+            for i in range(desc.attributes.length):
+                attr = desc.attributes.item(i)
+                if attr.namespaceURI == namespace:
+                    yield attr
+            for child in desc.childNodes:
+                if child.namespaceURI == namespace:
+                    yield child
+
+    def prime_cache(self) -> None:
+        """
+        Eagerly populate the property cache for every known XMP field.
+
+        Useful when most fields are about to be read anyway, e.g. when
+        exporting the metadata for indexing: the whole batch costs a single
+        walk over the RDF tree plus one index lookup per field, instead of
+        per-property traversals. Reading a property afterwards is a plain
+        dict access.
+        """
+        for getter in _PROPERTY_GETTERS:
+            getter(self)
 
     def _get_text(self, element: XmlElement) -> str:
-        text = ""
-        for child in element.childNodes:
-            if child.nodeType == child.TEXT_NODE:
-                text += child.data
-        return text
+        children = element.childNodes
+        # the common case is a single text child
+        if len(children) == 1 and children[0].nodeType == children[0].TEXT_NODE:
+            return children[0].data
+        return "".join(
+            child.data for child in children if child.nodeType == child.TEXT_NODE
+        )
 
     dc_contributor = property(_getter_bag(DC_NAMESPACE, "contributor"))
     """
@@ -373,17 +435,10 @@ class XmpInformation(PdfObject):
         if not hasattr(self, "_custom_properties"):
             self._custom_properties = {}
             for node in self.get_nodes_in_namespace("", PDFX_NAMESPACE):
-                key = node.localName
-                while True:
-                    # see documentation about PDFX_NAMESPACE earlier in file
-                    idx = key.find("\u2182")
-                    if idx == -1:
-                        break
-                    key = (
-                        key[:idx]
-                        + chr(int(key[idx + 1 : idx + 5], base=16))
-                        + key[idx + 5 :]
-                    )
+                # see documentation about PDFX_NAMESPACE earlier in file
+                key = _PDFX_KEY_ESCAPE.sub(
+                    lambda match: chr(int(match.group(1), base=16)), node.localName
+                )
                 if node.nodeType == node.ATTRIBUTE_NODE:
                     value = node.nodeValue
                 else:
@@ -26,6 +26,14 @@ def test_repr(page_range, expected):
     assert repr(PageRange(page_range)) == expected
 
 
+def test_hash():
+    pr1 = PageRange("1:5")
+    pr2 = PageRange(slice(1, 5))
+    assert hash(pr1) == hash(pr2)
+    assert {pr1: "a"}[pr2] == "a"
+    assert len({pr1, pr2, PageRange(":")}) == 2
+
+
 def test_equality_other_objectc():
     pr1 = PageRange(slice(0, 5))
     pr2 = "PageRange(slice(0, 5))"
@@ -64,6 +64,25 @@ def test_read_xmp_metadata(src, has_xmp):
         assert xmp.dc_contributor == []
 
 
+def test_prime_cache():
+    """prime_cache fills the cache with the values lazy access would yield."""
+    reader = PdfReader(RESOURCE_ROOT / "commented-xmp.pdf")
+    primed = reader.xmp_metadata
+    primed.prime_cache()
+    # the cache must be filled eagerly, before any property is read lazily
+    assert primed._cache
+    assert (pypdf.xmp.DC_NAMESPACE, "creator") in primed._cache
+    lazy = PdfReader(RESOURCE_ROOT / "commented-xmp.pdf").xmp_metadata
+    names = [
+        name
+        for name in dir(pypdf.xmp.XmpInformation)
+        if name.startswith(("dc_", "pdf_", "xmp_", "xmpmm_"))
+    ]
+    assert names
+    for name in names:
+        assert getattr(primed, name) == getattr(lazy, name)
+
+
 def get_all_tiff(xmp: pypdf.xmp.XmpInformation):
     """Return all TIFF metadata as a dictionary."""
     data = {}